@@ -1,2 +0,0 @@
-from .api import CycleTLS
-from .schema import *
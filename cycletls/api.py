@@ -2,6 +2,7 @@ import json
 from websocket import create_connection
 from .schema import Response, Request
 import subprocess
+import threading
 from time import sleep
 import psutil
 
@@ -20,7 +21,10 @@ def kill(proc_pid):
 
 
 class CycleTLS:
+    __slots__ = ("_lock", "ws", "proc", "__weakref__")
+
     def __init__(self):
+        self._lock = threading.Lock()
         try:
             self.ws = create_connection("ws://localhost:8080")
             self.proc = None
@@ -38,10 +42,15 @@ class CycleTLS:
             "requestId": "requestId",
             "options": request.dict(by_alias=True, exclude_none=True),
         }
-        self.ws.send(json.dumps(request))
-        response = json.loads(self.ws.recv())
-
-        return Response(**response)
+        payload = json.dumps(request)
+        ws = self.ws
+        # every request shares one socket and request id, so keep each send/recv pair together
+        with self._lock:
+            ws.send(payload)
+            raw = ws.recv()
+        response = json.loads(raw)
+
+        return Response.from_sidecar(response)
 
     def get(self, url, params=None, **kwargs) -> Response:
         """Sends an GET request.
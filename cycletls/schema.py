@@ -1,21 +1,44 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, validator
 import json
+import sys
 from typing import Optional, List
 
+__all__ = ["Cookie", "Request", "Response"]
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Every request shares these unless overridden, so intern them once at import
+_DEFAULT_JA3 = sys.intern(
+    "771,4865-4867-4866-49195-49199-52393-52392-49196-49200-49162-49161-49171-49172-51-57-47-53-10,0-23-65281-10-11-35-16-5-51-43-13-45-28-21,29-23-24-25-256-257,0"
+)
+_DEFAULT_USER_AGENT = sys.intern(
+    "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:87.0) Gecko/20100101 Firefox/87.0"
+)
+
+
 class Cookie(BaseModel):
     #TODO
     test: int
 
 
 class Request(BaseModel):
+    """Options sent to the Go sidecar for a single request.
+
+    Empty ``cookies`` and ``header_order`` lists are treated as unset and
+    left out of the serialized payload.
+    """
+
     url: str
     method: str
     body: str = ""
     headers: dict = {}
-    ja3: str = "771,4865-4867-4866-49195-49199-52393-52392-49196-49200-49162-49161-49171-49172-51-57-47-53-10,0-23-65281-10-11-35-16-5-51-43-13-45-28-21,29-23-24-25-256-257,0"
-    user_agent: str = (
-        "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:87.0) Gecko/20100101 Firefox/87.0"
-    )
+    ja3: str = _DEFAULT_JA3
+    user_agent: str = _DEFAULT_USER_AGENT
     proxy: str = ""
     cookies: Optional[List] = None
     timeout: int = 6
@@ -29,6 +52,10 @@ class Request(BaseModel):
             "disable_redirect": "disableRedirect",
         }
 
+    @validator("cookies", "header_order")
+    def drop_empty(cls, value):
+        return value or None
+
 
 class Response(BaseModel):
     request_id: str
@@ -44,8 +71,41 @@ class Response(BaseModel):
             "body": "Body",
         }
 
+    @classmethod
+    def from_sidecar(cls, data: dict) -> "Response":
+        """Builds a Response from a Go sidecar payload without re-validating
+        the fields the sidecar's Go struct already types.
+
+        Payloads with a missing field or ``Headers: null`` (the zero value the
+        sidecar sends when it fails to read a response) go through normal
+        validation and raise ``ValidationError``.
+        """
+        try:
+            headers = data["Headers"]
+            if headers is not None:
+                return cls.construct(
+                    request_id=data["RequestID"],
+                    status_code=data["Status"],
+                    headers=headers,
+                    body=data["Body"],
+                )
+        except KeyError:
+            pass
+        return cls(**data)
+
     def json(self) -> dict:
-        return json.loads(self.body)
+        """Parses the response body as JSON.
+
+        Uses orjson whenever it can be imported, whether it came from the
+        ``cycletls[speedups]`` extra or was installed by another package,
+        otherwise the stdlib ``json`` module. With orjson, integers wider than
+        64 bits come back as floats and lose precision, and ``NaN``,
+        ``Infinity``, out-of-range numbers such as ``1e400`` and lone surrogate
+        escapes such as ``"\\ud800"`` raise ``JSONDecodeError`` instead of
+        parsing. Both parsers raise a subclass of ``json.JSONDecodeError`` on
+        invalid input.
+        """
+        return _json_loads(self.body)
 
 
 
@@ -4,26 +4,26 @@
 # list see the documentation:
 # https://www.sphinx-doc.org/en/master/usage/configuration.html
 
-import os
-import sys
-from datetime import datetime
+import re
+from pathlib import Path
 
-# -- Path setup --------------------------------------------------------------
+# -- Version -----------------------------------------------------------------
 
-# If extensions (or modules to document with autodoc) are in another directory,
-# add these directories to sys.path here. If the directory is relative to the
-# documentation root, use os.path.abspath to make it absolute, like shown here.
-#
-
-sys.path.insert(0, os.path.abspath("../../"))
-
-from my_package.version import VERSION, VERSION_SHORT  # noqa: E402
+# Read the version as text rather than importing the package, which would pull in
+# its runtime dependencies just to configure the docs.
+_version_file = Path(__file__).resolve().parents[2] / "cycletls" / "__version__.py"
+_match = re.search(r"^__version__ = ['\"]([^'\"]+)['\"]", _version_file.read_text(), re.MULTILINE)
+if _match is None:
+    raise RuntimeError(f"no __version__ in {_version_file}")
+VERSION = _match.group(1)
+VERSION_SHORT = ".".join(VERSION.split(".")[:2])
 
 # -- Project information -----------------------------------------------------
 
 project = "my-package"
-copyright = f"{datetime.today().year}, Allen Institute for Artificial Intelligence"
-author = "Allen Institute for Artificial Intelligence"
+# Static on purpose: a computed year changes the config and forces Sphinx to rewrite every page.
+copyright = "2022, Danny Dasilva"
+author = "Danny Dasilva"
 version = VERSION_SHORT
 release = VERSION
 
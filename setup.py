@@ -14,6 +14,7 @@ setup(
     long_description_content_type="text/markdown",
     long_description=README,
     install_requires=[],
+    extras_require={"speedups": ["orjson"]},
     url='https://github.com/Danny-Dasilva/cycletls_python',
     author='Danny-Dasilva',
     author_email='dannydasilva.solutions@gmail.com'
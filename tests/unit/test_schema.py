@@ -0,0 +1,79 @@
+import importlib.util
+import json
+import math
+import sys
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from cycletls import Request, Response, schema
+
+
+def test_response_from_sidecar():
+    payload = {
+        "RequestID": "requestId",
+        "Status": 200,
+        "Headers": {"Content-Type": "application/json"},
+        "Body": '{"ja3_hash": "abc"}',
+    }
+    response = Response.from_sidecar(payload)
+
+    assert response == Response(**payload)
+    assert response.json() == {"ja3_hash": "abc"}
+
+
+def test_response_from_sidecar_null_headers():
+    payload = {"RequestID": "", "Status": 0, "Body": "", "Headers": None}
+    with pytest.raises(ValidationError):
+        Response.from_sidecar(payload)
+
+
+def test_response_from_sidecar_missing_field():
+    with pytest.raises(ValidationError):
+        Response.from_sidecar({"RequestID": "requestId", "Status": 200, "Body": ""})
+
+
+def _load_schema_without_orjson(monkeypatch):
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    path = Path(schema.__file__)
+    spec = importlib.util.spec_from_file_location("_schema_without_orjson", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _response(module, body):
+    return module.Response(RequestID="requestId", Status=200, Headers={}, Body=body)
+
+
+def test_response_json_stdlib_fallback(monkeypatch):
+    fallback = _load_schema_without_orjson(monkeypatch)
+
+    assert fallback._json_loads is json.loads
+    assert _response(fallback, '{"a": 123456789012345678901234567890}').json() == {
+        "a": 123456789012345678901234567890
+    }
+    assert math.isnan(_response(fallback, "NaN").json())
+    assert _response(fallback, "1e400").json() == math.inf
+    assert _response(fallback, r'"\ud800"').json() == "\ud800"
+    with pytest.raises(json.JSONDecodeError):
+        _response(fallback, "{").json()
+
+
+def test_response_json_orjson():
+    orjson = pytest.importorskip("orjson")
+
+    assert schema._json_loads is orjson.loads
+    assert _response(schema, '{"ja3_hash": "abc"}').json() == {"ja3_hash": "abc"}
+    for body in ("NaN", "1e400", r'"\ud800"', "{"):
+        with pytest.raises(json.JSONDecodeError):
+            _response(schema, body).json()
+
+
+def test_request_drops_empty_collections():
+    request = Request(url="https://ja3er.com/json", method="get", cookies=[], header_order=[])
+    options = request.dict(by_alias=True, exclude_none=True)
+
+    assert "cookies" not in options
+    assert "header_order" not in options